@@ -1,23 +1,279 @@
 # -*- coding: utf-8 -*-
 
+import functools
+import getpass
 import json
 import os
 import requests
 import re
 import html
+import textwrap
 import time
 import random
 from datetime import datetime
 import platform
+import queue
 import subprocess
 import sys
 import threading  # Still needed for both modes
+import weakref
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Global variables to hold GUI modules when imported
 tk = None
 ttk = None
 scrolledtext = None
 
+# GUI classes, defined by define_gui_classes() once the modules above are imported
+GreenScrollbar = None
+CustomTitleBar = None
+TerminalText = None
+HIBPScannerApp = None
+
+########################
+# JSON ENCODE / DECODE
+########################
+# orjson is optional; it decodes and encodes several times faster than the stdlib
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        """Serialize obj to indented UTF-8 JSON bytes"""
+        # OPT_NON_STR_KEYS accepts the same dict keys the json fallback does
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        """Serialize obj to indented UTF-8 JSON bytes"""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+def decode_json_response(resp):
+    """
+    Decode a response body with _loads. A body that isn't JSON (e.g. a proxy or
+    challenge page) raises InvalidJSONError, a RequestException, like resp.json().
+    """
+    try:
+        return _loads(resp.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(f"Invalid JSON in response from {resp.url}: {e}", response=resp)
+
+########################
+# HIBP HTTP SESSION
+########################
+# One shared session so the breachedaccount call and every /breach/{name}
+# follow-up reuse the same keep-alive connection instead of a fresh TLS handshake.
+HTTP_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+BREACH_FETCH_WORKERS = 8   # concurrent /breach/{name} detail requests
+
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "NULLNETSecurityScanner/1.0"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    # Retry also honors HIBP's Retry-After on 429 rate-limit responses
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+class RateLimiter:
+    """Spaces calls at least `interval` seconds apart; safe to share between threads"""
+    def __init__(self, interval):
+        self.interval = interval
+        self.next_allowed = 0.0
+        self.lock = threading.Lock()
+        
+    def wait(self):
+        """Block until the next call is allowed, then reserve the following slot"""
+        with self.lock:
+            now = time.monotonic()
+            if now < self.next_allowed:
+                time.sleep(self.next_allowed - now)
+                now = self.next_allowed
+            self.next_allowed = now + self.interval
+
+# HIBP allows one authenticated (API-key) request per 1.5s on the basic tier.
+# Anything that still gets a 429 is retried by the adapter, honoring Retry-After.
+HIBP_RATE_LIMITER = RateLimiter(1.5)
+
+# Breach metadata barely changes, so /breach/{name} responses are cached on disk
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nullnet")
+BREACH_CACHE_TTL = 24 * 60 * 60  # seconds
+_CACHE_NAME_RE = re.compile(r"[^a-zA-Z0-9._\-]")  # characters replaced in cache file names
+
+_breach_memo = {}  # name -> (fetched_at, data), so repeat scans skip even the disk read
+
+def fetch_breach_details(name, headers, ttl=BREACH_CACHE_TTL):
+    """
+    Return the HIBP metadata for a single breach, served from memory or the
+    local cache when a copy younger than `ttl` seconds exists.
+    Returns None if HIBP does not know the breach (404).
+    """
+    memo = _breach_memo.get(name)
+    if memo and time.time() - memo[0] < ttl:
+        return memo[1]
+    
+    cache_file = os.path.join(CACHE_DIR, _CACHE_NAME_RE.sub("_", name) + ".json")
+    try:
+        fetched_at = os.path.getmtime(cache_file)
+        if time.time() - fetched_at < ttl:
+            with open(cache_file, "rb") as infile:
+                breach_data = _loads(infile.read())
+            _breach_memo[name] = (fetched_at, breach_data)
+            return breach_data
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache entry: refetch below
+
+    resp = SESSION.get(f"https://haveibeenpwned.com/api/v3/breach/{quote(name, safe='')}", headers=headers, timeout=HTTP_TIMEOUT)
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
+    breach_data = decode_json_response(resp)
+    _breach_memo[name] = (time.time(), breach_data)
+
+    try:
+        # Store the body exactly as received; no need to re-encode what we just parsed
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_file, "wb") as outfile:
+            outfile.write(resp.content)
+    except OSError:
+        pass  # Caching is best-effort
+    return breach_data
+
+########################
+# BACKGROUND JSON WRITER
+########################
+# Saving breach files is handed to one daemon thread so disk writes overlap
+# with the network fetches instead of stalling between them.
+# Each scan passes its own error list, so failures are only reported by the
+# scan that queued the file.
+_write_q = queue.Queue()
+
+def _json_writer():
+    while True:
+        path, data, errors = _write_q.get()
+        try:
+            with open(path, "wb") as outfile:
+                outfile.write(_dumps(data))
+        except Exception as e:
+            # Anything escaping here would kill the writer and hang wait_for_json_writes()
+            errors.append((path, e))
+        finally:
+            _write_q.task_done()
+
+threading.Thread(target=_json_writer, daemon=True).start()
+
+def queue_json_write(path, data, errors):
+    """Save `data` as indented JSON at `path` on the writer thread; failures go to `errors` as (path, error)"""
+    _write_q.put((path, data, errors))
+
+def wait_for_json_writes():
+    """Block until every queued file is written"""
+    _write_q.join()
+
+########################
+# TEXT FORMATTING HELPERS
+########################
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+
+# The entities HIBP descriptions actually use, decoded with plain str.replace.
+# &amp; goes last so "&amp;lt;" comes out as "&lt;", as with html.unescape.
+_COMMON_ENTITIES = (
+    ("&lt;", "<"),
+    ("&gt;", ">"),
+    ("&quot;", '"'),
+    ("&#39;", "'"),
+    ("&nbsp;", "\xa0"),
+    ("&amp;", "&"),
+)
+
+def _unescape(text):
+    """html.unescape, with a fast path for text using only _COMMON_ENTITIES"""
+    if "&" not in text:
+        return text  # Nothing to decode, which is the usual case once tags are gone
+    if text.count("&") != sum(text.count(entity) for entity, _ in _COMMON_ENTITIES):
+        return html.unescape(text)  # Some other entity is in there
+    for entity, char in _COMMON_ENTITIES:
+        text = text.replace(entity, char)
+    return text
+
+# Breach descriptions are HTML; parse them natively with selectolax when it is
+# installed, otherwise strip the tags with a regex. Results are cached since the
+# same breach is rendered again on every scan that hits it.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    @functools.lru_cache(maxsize=256)
+    def strip_html(text):
+        """Return the visible text of an HTML fragment with entities decoded"""
+        tree = LexborHTMLParser(text)
+        for node in tree.css("script, style, noscript"):
+            node.decompose()
+        return tree.text(separator="")
+except ImportError:
+    @functools.lru_cache(maxsize=256)
+    def strip_html(text):
+        """Return the visible text of an HTML fragment with entities decoded"""
+        return _unescape(_HTML_TAG_RE.sub('', text))
+
+# Rows at the top of every breach summary, filled in with one format_map call
+_BREACH_FIELDS_TEMPLATE = (
+    "Name:        {Name}\n"
+    "Title:       {Title}\n"
+    "Domain:      {Domain}\n"
+    "Breach Date: {BreachDate}\n"
+    "Added Date:  {AddedDate}\n"
+    "Modified:    {ModifiedDate}\n"
+    "Pwn Count:   {PwnCount}"
+)
+
+class _FieldsOrNA(dict):
+    """Breach data for format_map, with "N/A" for any field HIBP left out"""
+    def __missing__(self, key):
+        return "N/A"
+
+_WRAPPERS = {}
+
+def _get_wrapper(width):
+    """Return a TextWrapper for `width`, built once and reused."""
+    wrapper = _WRAPPERS.get(width)
+    if wrapper is None:
+        wrapper = _WRAPPERS[width] = textwrap.TextWrapper(width=width)
+    return wrapper
+
+# [epoch second, date string, time string] of the last status bar stamp
+_LAST_TS = [0, "", ""]
+
+def _status_timestamp():
+    """Return (date_str, time_str) for the status bar, formatted at most once per second."""
+    now = int(time.time())
+    if now != _LAST_TS[0]:
+        dt = datetime.fromtimestamp(now)
+        _LAST_TS[:] = [now, f"{dt.year:04d}.{dt.month:02d}.{dt.day:02d}", f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"]
+    return _LAST_TS[1], _LAST_TS[2]
+
+########################
+# INPUT VALIDATION
+########################
+# Rough shape check only; it is enough to avoid spending an HIBP request on a typo
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]")
+
+# Used by the GUI to scrub pasted input before it reaches the API
+_RE_WS = re.compile(r"[\r\n\t]+")
+_RE_EMAIL_CHARS = re.compile(r"[^a-zA-Z0-9@._\-+]")
+_RE_BREACH_CHARS = re.compile(r"[^a-zA-Z0-9._\-]+")
+
+MAX_EMAIL_LENGTH = 254        # RFC 5321 limit for a forward path
+MAX_BREACH_NAME_LENGTH = 100  # HIBP breach names are short identifiers
+
+# "user@example.com" -> "user_at_example_dot_com" for the per-email results folder
+_EMAIL_FOLDER_TRANS = str.maketrans({"@": "_at_", ".": "_dot_"})
+
 ########################
 # CROSS-PLATFORM BEEPING
 ########################
@@ -28,49 +284,106 @@ ERROR_BEEP_LENGTH = 150  # ms
 
 def beep_linux(freq_hz, duration_ms):
     try:
-        subprocess.run(["beep", "-f", str(freq_hz), "-l", str(duration_ms)], check=False)
+        # Popen returns immediately so the beep plays while the scan carries on
+        subprocess.Popen(
+            ["beep", "-f", str(freq_hz), "-l", str(duration_ms)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
     except FileNotFoundError:
-        pass
+        # No 'beep' utility installed, fall back to the terminal bell
+        try:
+            sys.stdout.write("\a")
+            sys.stdout.flush()
+        except Exception:
+            pass
     except Exception:
         pass
 
+_winsound = None  # Imported on the first Windows beep
+
 def beep_windows(freq_hz, duration_ms):
+    global _winsound
     # Only import winsound when needed on Windows
     if SYSTEM == "Windows":
         try:
-            import winsound
-            winsound.Beep(freq_hz, duration_ms)
+            if _winsound is None:
+                import winsound as _winsound
+            # winsound.Beep blocks for the whole duration, so play it off-thread
+            threading.Thread(target=_winsound.Beep, args=(freq_hz, duration_ms), daemon=True).start()
         except ImportError:
             pass
+        except Exception:
+            pass
 
 def beep_error():
     """Plays a short beep on error if the platform supports it."""
+    # Both helpers swallow their own errors
     if SYSTEM == "Windows":
-        try:
-            beep_windows(ERROR_BEEP_FREQ, ERROR_BEEP_LENGTH)
-        except:
-            pass
+        beep_windows(ERROR_BEEP_FREQ, ERROR_BEEP_LENGTH)
     elif SYSTEM == "Linux":
         beep_linux(ERROR_BEEP_FREQ, ERROR_BEEP_LENGTH)
 
+def enable_windows_ansi():
+    """
+    Turn on ANSI escape processing for the Windows 10+ console.
+    Returns True if the console will interpret ANSI sequences.
+    """
+    if SYSTEM != "Windows":
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+def enable_utf8_output():
+    """
+    Switch stdout/stderr to UTF-8 in place on Windows, where the console code
+    page often can't encode the box-drawing characters. reconfigure() keeps the
+    C-level TextIOWrapper rather than wrapping it in a codecs StreamWriter.
+    """
+    if SYSTEM != "Windows":
+        return
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(encoding="utf-8")
+        except (AttributeError, ValueError):
+            pass
+
+_DISPLAY_AVAILABLE = None  # Cached result of is_display_available()
+_PROBE_ROOT = None         # Tk root opened by the display probe, reused by the GUI
+
 # Add this function near the top of the file, after imports
 def is_display_available():
     """Check if a display server is available (for GUI)"""
+    global _DISPLAY_AVAILABLE, _PROBE_ROOT
+    if _DISPLAY_AVAILABLE is not None:
+        return _DISPLAY_AVAILABLE
+    
     # Check if running on Linux or Unix-like system
     if SYSTEM == "Windows":
-        return True  # Windows always has a display
+        _DISPLAY_AVAILABLE = True  # Windows always has a display
     
-    # For Linux/Unix, check if DISPLAY is set
-    if 'DISPLAY' in os.environ and os.environ['DISPLAY']:
+    # For Linux/Unix, only probe Tk when a display server is advertised
+    elif os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'):
         try:
-            # Try importing Tkinter as a test
+            # Try creating a Tk root as a test; keep it so the GUI can use it
+            # instead of connecting to the display a second time
             import tkinter
-            test_root = tkinter.Tk()
-            test_root.destroy()
-            return True
+            _PROBE_ROOT = tkinter.Tk()
+            _DISPLAY_AVAILABLE = True
         except:
-            return False
-    return False
+            _DISPLAY_AVAILABLE = False
+    else:
+        _DISPLAY_AVAILABLE = False
+    return _DISPLAY_AVAILABLE
 
 # Function to import GUI modules only when needed
 def import_gui_modules():
@@ -87,6 +400,20 @@ def import_gui_modules():
 # Add this terminal-only version of the app
 class TerminalOnlyApp:
     """Terminal-only version of the HIBP scanner that visually resembles the GUI version"""
+    # Main interface frame pieces (74 columns between the side borders)
+    FRAME_TOP   = "╔" + "═" * 74 + "╗"
+    FRAME_MID   = "╠" + "═" * 74 + "╣"
+    FRAME_BOT   = "╚" + "═" * 74 + "╝"
+    FRAME_BLANK = "║" + " " * 74 + "║"
+    
+    # Breach summary box
+    BOX_WIDTH = 60
+    BOX_TOP   = "╔" + "═" * (BOX_WIDTH - 2) + "╗"
+    BOX_MID   = "╠" + "═" * (BOX_WIDTH - 2) + "╣"
+    BOX_BOT   = "╚" + "═" * (BOX_WIDTH - 2) + "╝"
+    BOX_LINE  = f"║ {{:<{BOX_WIDTH - 4}}} ║".format  # pads a row to fit between the borders
+    BOX_FIELD = f"║ {{:<13}}{{!s:<{BOX_WIDTH - 17}}} ║".format  # same, for a (label, value) row
+    
     def __init__(self):
         # Terminal colors using ANSI escape codes
         self.COLORS = {
@@ -109,6 +436,33 @@ class TerminalOnlyApp:
                 self.use_colors = False
         except:
             self.use_colors = False
+        
+        # Legacy Windows consoles need VT mode switched on before ANSI codes
+        # (colors and the fast clear_screen path) are understood
+        if self.use_colors and not enable_windows_ansi():
+            self.use_colors = False
+        enable_utf8_output()
+        
+        # Block-buffer stdout instead of flushing on every newline; output is
+        # flushed explicitly once per screen, per breach and before each wait
+        try:
+            sys.stdout.reconfigure(line_buffering=False)
+        except (AttributeError, ValueError):
+            pass
+        
+        # Resolve each color to its escape code once, or to "" when colors are off
+        self.C = {name: (code if self.use_colors else "") for name, code in self.COLORS.items()}
+        self.R = self.C["reset"]
+        
+        # Without colors every color_text call is the identity; decide that once here
+        if not self.use_colors:
+            self.color_text = lambda text, color_code: text
+        
+        # Header-colored frame lines, built once instead of on every redraw
+        H = self.C["header"]
+        self.frame_top, self.frame_mid, self.frame_bot, self.frame_blank = (
+            f"{H}{line}{self.R}" for line in (self.FRAME_TOP, self.FRAME_MID, self.FRAME_BOT, self.FRAME_BLANK)
+        )
             
         # Clear screen and display header
         self.clear_screen()
@@ -123,14 +477,17 @@ class TerminalOnlyApp:
         self.run()
         
     def color_text(self, text, color_code):
-        """Apply color to text if colors are enabled"""
-        if self.use_colors:
-            return f"{color_code}{text}{self.COLORS['reset']}"
-        return text
+        """Apply color to text (replaced by a no-op in __init__ when colors are disabled)"""
+        return f"{color_code}{text}\033[0m"
         
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if SYSTEM == 'Windows' else 'clear')
+        if self.use_colors:
+            # The terminal already understands our ANSI colors, so skip spawning a shell
+            sys.stdout.write("\033[2J\033[H")
+            sys.stdout.flush()
+        else:
+            os.system('cls' if SYSTEM == 'Windows' else 'clear')
         
     def display_welcome_message(self):
         """Display the welcome message with ASCII art header"""
@@ -159,17 +516,17 @@ VISUAL COMPATIBILITY MODE ENABLED
 READY TO SCAN FOR SECURITY BREACHES.
 """, self.COLORS["text"])
         
-        print(header)
-        print(status)
-        print(mode_info)
-        print(instructions)
+        sys.stdout.write("\n".join((header, status, mode_info, instructions)) + "\n")
+        sys.stdout.flush()
         
     def draw_interface(self):
         """Draw the main interface layout"""
         self.clear_screen()
         
+        # Cached color prefixes (empty strings when colors are disabled)
+        H, B, T, R = self.C["header"], self.C["bold"], self.C["text"], self.R
+        
         # Header section
-        print(self.color_text("╔══════════════════════════════════════════════════════════════════════════╗", self.COLORS["header"]))
         header_text = "NULLNET"
         subtitle = "SECURITY BREACH DETECTION SYSTEM"
         status = "[ ONLINE ]"
@@ -179,44 +536,51 @@ READY TO SCAN FOR SECURITY BREACHES.
         left_part = f"{header_text}    {subtitle}"
         padding = total_width - len(left_part) - len(status)
         
-        print(self.color_text(f"║ {self.color_text(header_text, self.COLORS['bold'])}    {subtitle}{' ' * padding}{status} ║", self.COLORS["header"]))
-        print(self.color_text("╠══════════════════════════════════════════════════════════════════════════╣", self.COLORS["header"]))
-        
-        # Input section (left panel)
-        print(self.color_text("║                                                                          ║", self.COLORS["header"]))
-        print(self.color_text("║  " + self.color_text("SCAN PARAMETERS:", self.COLORS["bold"]) + "                                                     ║", self.COLORS["header"]))
-        print(self.color_text("║  ───────────────────────────────────────────                            ║", self.COLORS["header"]))
-        print(self.color_text("║                                                                          ║", self.COLORS["header"]))
-        print(self.color_text(f"║  EMAIL ADDRESS:                                                          ║", self.COLORS["header"]))
-        print(self.color_text(f"║  {self.color_text(self.email if self.email else '<Enter email to scan>', self.COLORS['text'])}                       ║", self.COLORS["header"]))
-        print(self.color_text("║                                                                          ║", self.COLORS["header"]))
-        print(self.color_text(f"║  BREACH NAME (OPTIONAL):                                                 ║", self.COLORS["header"]))
-        print(self.color_text(f"║  {self.color_text(self.breach if self.breach else '<Enter breach to lookup>', self.COLORS['text'])}                  ║", self.COLORS["header"]))
-        print(self.color_text("║                                                                          ║", self.COLORS["header"]))
-        print(self.color_text(f"║  HIBP API KEY:                                                           ║", self.COLORS["header"]))
+        # The whole frame is collected here and written in one go
+        lines = [
+            self.frame_top,
+            f"{H}║ {B}{header_text}{R}{H}    {subtitle}{' ' * padding}{status} ║{R}",
+            self.frame_mid,
+            
+            # Input section (left panel)
+            self.frame_blank,
+            f"{H}║  {B}SCAN PARAMETERS:{R}{H}                                                     ║{R}",
+            f"{H}║  ───────────────────────────────────────────                            ║{R}",
+            self.frame_blank,
+            f"{H}║  EMAIL ADDRESS:                                                          ║{R}",
+            f"{H}║  {T}{self.email if self.email else '<Enter email to scan>'}{R}{H}                       ║{R}",
+            self.frame_blank,
+            f"{H}║  BREACH NAME (OPTIONAL):                                                 ║{R}",
+            f"{H}║  {T}{self.breach if self.breach else '<Enter breach to lookup>'}{R}{H}                  ║{R}",
+            self.frame_blank,
+            f"{H}║  HIBP API KEY:                                                           ║{R}",
+        ]
         
         # Show API key status
         if self.api_key:
             api_display = "********" + self.api_key[-4:] if len(self.api_key) > 4 else "********"
-            print(self.color_text(f"║  {self.color_text(api_display, self.COLORS['text'])}                                                  ║", self.COLORS["header"]))
+            lines.append(f"{H}║  {T}{api_display}{R}{H}                                                  ║{R}")
         else:
-            print(self.color_text(f"║  {self.color_text('<API key required>', self.COLORS['warning'])}                                           ║", self.COLORS["header"]))
+            lines.append(f"{H}║  {self.C['warning']}<API key required>{R}{H}                                           ║{R}")
         
-        print(self.color_text("║                                                                          ║", self.COLORS["header"]))
-        print(self.color_text("║  " + self.color_text("[1] INITIATE SCAN", self.COLORS["accent"]) + "    " + self.color_text("[2] CLEAR", self.COLORS["accent"]) + "    " + self.color_text("[0] EXIT", self.COLORS["accent"]) + "                    ║", self.COLORS["header"]))
-        print(self.color_text("║                                                                          ║", self.COLORS["header"]))
+        A = self.C["accent"]
+        lines.append(self.frame_blank)
+        lines.append(f"{H}║  {A}[1] INITIATE SCAN{R}{H}    {A}[2] CLEAR{R}{H}    {A}[0] EXIT{R}{H}                    ║{R}")
+        lines.append(self.frame_blank)
         
         # Status bar at bottom
-        date_str = datetime.now().strftime("%Y.%m.%d")
-        time_str = datetime.now().strftime("%H:%M:%S")
+        date_str, time_str = _status_timestamp()
         datetime_display = f"DATE: {date_str} | TIME: {time_str}"
         
         status_text = "SYSTEM READY"
         padding = total_width - len(status_text) - len(datetime_display)
         
-        print(self.color_text("╠══════════════════════════════════════════════════════════════════════════╣", self.COLORS["header"]))
-        print(self.color_text(f"║ {status_text}{' ' * padding}{datetime_display} ║", self.COLORS["header"]))
-        print(self.color_text("╚══════════════════════════════════════════════════════════════════════════╝", self.COLORS["header"]))
+        lines.append(self.frame_mid)
+        lines.append(f"{H}║ {status_text}{' ' * padding}{datetime_display} ║{R}")
+        lines.append(self.frame_bot)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
     def run(self):
         """Main application loop"""
@@ -240,13 +604,13 @@ READY TO SCAN FOR SECURITY BREACHES.
                 
     def prepare_scan(self):
         """Prepare for scanning by collecting necessary information"""
-        self.clear_screen()
+        # draw_interface clears the screen itself
         self.draw_interface()
         
         # First collect API key if not already set
         if not self.api_key:
             print("\nHIBP API Key required.")
-            import getpass
+            sys.stdout.flush()  # getpass prompts on the tty, not through stdout
             self.api_key = getpass.getpass("Enter HIBP API key: ")
             if not self.api_key:
                 print(self.color_text("\nError: API key is required. Press Enter to continue...", self.COLORS["warning"]))
@@ -255,20 +619,32 @@ READY TO SCAN FOR SECURITY BREACHES.
         
         # Now collect email or breach name
         print("\nEnter scan parameters (leave blank to skip):")
-        self.email = input("Email address to scan: ").strip()
+        # Validate into a local first so a rejected address never lands in self.email
+        email = input("Email address to scan: ").strip()
+        if email and (len(email) > MAX_EMAIL_LENGTH
+                      or _CONTROL_CHARS_RE.search(email)
+                      or not _EMAIL_RE.match(email)):
+            self.email = ""
+            print(self.color_text("\nError: Invalid email address. Press Enter to continue...", self.COLORS["warning"]))
+            input()
+            return
+        self.email = email
+        # An email scan must not also look up a breach name left from an earlier pass
+        self.breach = ""
         if not self.email:
-            self.breach = input("Breach name to lookup: ").strip()
+            breach = input("Breach name to lookup: ").strip()
+            if len(breach) > MAX_BREACH_NAME_LENGTH or _CONTROL_CHARS_RE.search(breach):
+                print(self.color_text("\nError: Invalid breach name. Press Enter to continue...", self.COLORS["warning"]))
+                input()
+                return
+            self.breach = breach
             
         if not self.email and not self.breach:
             print(self.color_text("\nError: Email or breach name is required. Press Enter to continue...", self.COLORS["warning"]))
             input()
             return
         
-        # Update the interface to show entered values
-        self.clear_screen()
-        self.draw_interface()
-        
-        # Now perform the scan
+        # Now perform the scan (it clears and draws its own output screen)
         self.perform_scan()
         
     def perform_scan(self):
@@ -281,28 +657,24 @@ READY TO SCAN FOR SECURITY BREACHES.
         print(self.color_text("╚══════════════════════════════════════════════════════╝", self.COLORS["header"]))
         print()
         
-        headers = {
-            "hibp-api-key": self.api_key,
-            "User-Agent": "NULLNETSecurityScanner/1.0"
-        }
+        headers = {"hibp-api-key": self.api_key}
         
         print(self.color_text(">>> INITIATING SCAN...", self.COLORS["accent"]))
-        time.sleep(0.5)
         
         # If email is provided
         if self.email:
             print(self.color_text(f"\n>>> SCANNING EMAIL: {self.email}", self.COLORS["header"]))
-            time.sleep(0.5)
             
-            folder_name = self.email.replace("@", "_at_").replace(".", "_dot_")
+            folder_name = self.email.translate(_EMAIL_FOLDER_TRANS)
             os.makedirs(folder_name, exist_ok=True)
             
-            url = f"https://haveibeenpwned.com/api/v3/breachedaccount/{self.email}"
+            url = f"https://haveibeenpwned.com/api/v3/breachedaccount/{quote(self.email, safe='')}"
             try:
                 print(self.color_text(">>> CONNECTING TO HIBP DATABASE...", self.COLORS["text"]))
-                time.sleep(0.5)
+                sys.stdout.flush()
                 
-                resp = requests.get(url, headers=headers)
+                HIBP_RATE_LIMITER.wait()
+                resp = SESSION.get(url, headers=headers, timeout=HTTP_TIMEOUT)
                 
                 if resp.status_code == 404:
                     # 404 on this endpoint means "no breaches found"
@@ -314,7 +686,7 @@ READY TO SCAN FOR SECURITY BREACHES.
                     
                 resp.raise_for_status()
                 
-                breach_list = resp.json()
+                breach_list = decode_json_response(resp)
                 if not breach_list:
                     print(self.color_text("\n>>> SCAN COMPLETE: NO BREACHES FOUND", self.COLORS["accent"]))
                     print("\nPress Enter to continue...")
@@ -322,25 +694,44 @@ READY TO SCAN FOR SECURITY BREACHES.
                     return
                 
                 print(self.color_text(f"\n>>> ALERT: FOUND {len(breach_list)} BREACH(ES)", self.COLORS["warning"]))
-                time.sleep(0.5)
                 
-                for breach_info in breach_list:
-                    breach_name = breach_info["Name"]
-                    print(self.color_text(f"\n>>> RETRIEVING DETAILS FOR: {breach_name}", self.COLORS["accent"]))
-                    time.sleep(0.3)
-                    
-                    breach_url = f"https://haveibeenpwned.com/api/v3/breach/{breach_name}"
-                    br_resp = requests.get(breach_url, headers=headers)
-                    br_resp.raise_for_status()
-                    
-                    breach_data = br_resp.json()
-                    
-                    json_filename = os.path.join(folder_name, f"{breach_name}.json")
-                    with open(json_filename, "w", encoding="utf-8") as outfile:
-                        json.dump(breach_data, outfile, indent=2)
-                    print(self.color_text(f">>> SAVED: {json_filename}", self.COLORS["text"]))
+                save_errors = []  # (path, error) for files this scan failed to write
+                
+                # Fire off every detail request up front so the round trips overlap;
+                # results are still consumed in list order to keep the output stable.
+                executor = ThreadPoolExecutor(max_workers=BREACH_FETCH_WORKERS)
+                try:
+                    futures = [
+                        (breach_info["Name"], executor.submit(fetch_breach_details, breach_info["Name"], headers))
+                        for breach_info in breach_list
+                    ]
                     
-                    self.display_breach_summary(breach_data)
+                    for breach_name, future in futures:
+                        print(self.color_text(f"\n>>> RETRIEVING DETAILS FOR: {breach_name}", self.COLORS["accent"]))
+                        if not future.done():
+                            sys.stdout.flush()  # Show progress while we wait on the network
+                        
+                        breach_data = future.result()
+                        if breach_data is None:
+                            print(self.color_text(f">>> BREACH '{breach_name}' NOT FOUND", self.COLORS["warning"]))
+                            continue
+                        
+                        json_filename = os.path.join(folder_name, f"{breach_name}.json")
+                        queue_json_write(json_filename, breach_data, save_errors)
+                        print(self.color_text(f">>> SAVED: {json_filename}", self.COLORS["text"]))
+                        
+                        self.display_breach_summary(breach_data)
+                except BaseException:
+                    # Report errors (or Ctrl+C) now, not after every queued fetch and its retries
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                executor.shutdown()
+                
+                # Make sure everything reported as saved is actually on disk
+                wait_for_json_writes()
+                for json_filename, error in save_errors:
+                    beep_error()
+                    print(self.color_text(f"\n>>> ERROR SAVING {json_filename}: {error}", self.COLORS["warning"]))
                 
                 print(self.color_text("\n>>> SCAN COMPLETE", self.COLORS["accent"]))
                 print(self.color_text(f">>> ALL DATA SAVED TO FOLDER: {folder_name}", self.COLORS["text"]))
@@ -352,29 +743,23 @@ READY TO SCAN FOR SECURITY BREACHES.
         # If breach is provided
         if self.breach:
             print(self.color_text(f"\n>>> RETRIEVING BREACH: {self.breach}", self.COLORS["header"]))
-            time.sleep(0.5)
             
-            single_breach_url = f"https://haveibeenpwned.com/api/v3/breach/{self.breach}"
             try:
                 print(self.color_text(">>> CONNECTING TO HIBP DATABASE...", self.COLORS["text"]))
-                time.sleep(0.5)
+                sys.stdout.flush()
                 
-                resp = requests.get(single_breach_url, headers=headers)
+                breach_data = fetch_breach_details(self.breach, headers)
                 
-                if resp.status_code == 404:
+                if breach_data is None:
                     beep_error()
                     print(self.color_text(f"\n>>> BREACH '{self.breach}' NOT FOUND", self.COLORS["warning"]))
                     print("\nPress Enter to continue...")
                     input()
                     return
-                    
-                resp.raise_for_status()
-                
-                breach_data = resp.json()
                 
                 json_filename = f"{self.breach}.json"
-                with open(json_filename, "w", encoding="utf-8") as outfile:
-                    json.dump(breach_data, outfile, indent=2)
+                with open(json_filename, "wb") as outfile:
+                    outfile.write(_dumps(breach_data))
                 print(self.color_text(f">>> SAVED: {json_filename}", self.COLORS["text"]))
                 
                 self.display_breach_summary(breach_data)
@@ -390,72 +775,56 @@ READY TO SCAN FOR SECURITY BREACHES.
     
     def display_breach_summary(self, breach_data):
         """Display breach summary in a box format similar to the GUI"""
-        box_width = 60
-        top_border = "╔" + "═" * (box_width - 2) + "╗"
-        mid_border = "╠" + "═" * (box_width - 2) + "╣"
-        bot_border = "╚" + "═" * (box_width - 2) + "╝"
+        box_width = self.BOX_WIDTH
+        box_line = self.BOX_LINE
+        box_field = self.BOX_FIELD
+        text_color = self.COLORS["text"]
+        out = []  # Lines of the box, written to stdout in one call at the end
 
         # Top border
-        print(self.color_text("\n" + top_border, self.COLORS["header"]))
+        out.append(self.color_text("\n" + self.BOX_TOP, self.COLORS["header"]))
 
         # Centered title
         title_str = "BREACH DETAILS"
         centered_title = title_str.center(box_width - 4)
-        print(self.color_text(f"║ {centered_title} ║", self.COLORS["header"]))
+        out.append(self.color_text(box_line(centered_title), self.COLORS["header"]))
 
         # Mid border
-        print(self.color_text(mid_border, self.COLORS["header"]))
+        out.append(self.color_text(self.BOX_MID, self.COLORS["header"]))
 
         # Key lines (Name, Title, etc.)
-        lines = [
-            ("Name", breach_data.get("Name", "N/A")),
-            ("Title", breach_data.get("Title", "N/A")),
-            ("Domain", breach_data.get("Domain", "N/A")),
-            ("Breach Date", breach_data.get("BreachDate", "N/A")),
-            ("Added Date", breach_data.get("AddedDate", "N/A")),
-            ("Modified", breach_data.get("ModifiedDate", "N/A")),
-            ("Pwn Count", breach_data.get("PwnCount", "N/A")),
-        ]
-        
-        for label, value in lines:
-            label_text = f"{label}:"
-            line_str = f"{label_text:<12} {value}"
-            padded = line_str.ljust(box_width - 4)
-            print(self.color_text(f"║ {padded} ║", self.COLORS["text"]))
+        fields = _BREACH_FIELDS_TEMPLATE.format_map(_FieldsOrNA(breach_data))
+        out.extend(self.color_text(box_line(line), text_color) for line in fields.split("\n"))
 
         # Data classes
         data_classes = breach_data.get('DataClasses', [])
-        print(self.color_text(f"║ {'Data Classes:'.ljust(box_width - 4)} ║", self.COLORS["text"]))
-        for cls in data_classes:
-            padded = f"  - {cls}".ljust(box_width - 4)
-            print(self.color_text(f"║ {padded} ║", self.COLORS["text"]))
+        out.append(self.color_text(box_line("Data Classes:"), text_color))
+        out.extend(self.color_text(box_line(f"  - {cls}"), text_color) for cls in data_classes)
 
         verified = breach_data.get('IsVerified', 'N/A')
         fabricated = breach_data.get('IsFabricated', 'N/A')
-        print(self.color_text(f"║ {f'Verified:    {verified}'.ljust(box_width - 4)} ║", self.COLORS["text"]))
-        print(self.color_text(f"║ {f'Fabricated:  {fabricated}'.ljust(box_width - 4)} ║", self.COLORS["text"]))
+        out.append(self.color_text(box_field("Verified:", verified), text_color))
+        out.append(self.color_text(box_field("Fabricated:", fabricated), text_color))
 
         # Blank line
-        print(self.color_text(f"║ {' '.ljust(box_width - 4)} ║", self.COLORS["text"]))
+        out.append(self.color_text(box_line(""), text_color))
         # DESCRIPTION header
-        print(self.color_text(f"║ {'DESCRIPTION:'.ljust(box_width - 4)} ║", self.COLORS["text"]))
+        out.append(self.color_text(box_line("DESCRIPTION:"), text_color))
 
         # Description (may be long)
         description = breach_data.get('Description', '')
-        description_cleaned = re.sub(r'<[^>]*>', '', description)
-        description_cleaned = html.unescape(description_cleaned)
+        description_cleaned = strip_html(description)
         
         # Wrap description text to fit inside the box
-        import textwrap
-        wrapper = textwrap.TextWrapper(width=box_width - 4)
-        wrapped_text = wrapper.wrap(text=description_cleaned)
+        wrapped_text = _get_wrapper(box_width - 4).wrap(text=description_cleaned)
         
-        for line in wrapped_text:
-            padded = line.ljust(box_width - 4)
-            print(self.color_text(f"║ {padded} ║", self.COLORS["text"]))
+        out.extend(self.color_text(box_line(line), text_color) for line in wrapped_text)
 
         # Bottom border
-        print(self.color_text(bot_border, self.COLORS["header"]))
+        out.append(self.color_text(self.BOX_BOT, self.COLORS["header"]))
+        
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
 
 ############################
 # COLOR SCHEME & CONSTANTS
@@ -482,6 +851,8 @@ COLORS = {
 ############################
 def define_gui_classes():
     global GreenScrollbar, CustomTitleBar, TerminalText, HIBPScannerApp
+    if HIBPScannerApp is not None:  # Only define them once
+        return
     
     class GreenScrollbar(tk.Canvas):
         """Custom scrollbar with green styling"""
@@ -721,6 +1092,19 @@ def define_gui_classes():
         Handles 'typing' text into a Tkinter ScrolledText widget
         to mimic an old-school terminal output.
         """
+        MAX_LINES = 5000  # older lines are dropped so the widget stays small across scans
+        
+        BIND_TAG = "NullnetTerminal"
+        SCROLL_EVENTS = (
+            "<Button-4>", "<Button-5>",  # Linux scroll up/down
+            "<MouseWheel>",              # Windows
+            "<B1-Motion>",               # Drag scrollbar
+            # Key events that might cause scrolling
+            "<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>",
+        )
+        _instances = weakref.WeakValueDictionary()  # widget path -> TerminalText
+        _class_bound = False
+        
         def __init__(self, text_widget):
             self.text_widget = text_widget
             # Adjust these if you dislike the "typewriter" animation speed.
@@ -728,52 +1112,80 @@ def define_gui_classes():
             self.typing_speed = 0.00089 * 0.75
             self.typing_variation = 0.003 * 0.75
             
-            # Flag to track if auto-scrolling is enabled
+            # Flag to track if auto-scrolling is enabled (also picks _scroll_action)
             self.auto_scroll = True
             
             # Store the last visible position
             self.last_visible_position = 1.0
             
-            # Bind scroll events to detect manual scrolling
-            self.text_widget.bind("<Button-4>", self._on_manual_scroll)  # Linux scroll up
-            self.text_widget.bind("<Button-5>", self._on_manual_scroll)  # Linux scroll down
-            self.text_widget.bind("<MouseWheel>", self._on_manual_scroll)  # Windows
-            self.text_widget.bind("<B1-Motion>", self._on_manual_scroll)  # Drag scrollbar
+            # Output waiting to be shown, as (text, tag, on_done, typed) tuples.
+            # type_text/write_block are called from the scan thread too, so only
+            # _pump (running on the Tk thread via after()) ever touches the widget.
+            self.pending = queue.Queue()
+            self.current = None      # [text, tag, index, on_done, typed] being shown right now
+            self.chars_per_tick = 6  # characters inserted per after() tick
+            self.scroll_every = 48   # while typing, re-scroll at most once per this many characters
+            
+            # _pump only runs while there is output; _enqueue restarts it when idle
+            self.pumping = False
+            self.pump_lock = threading.Lock()
+            
+            # Detect manual scrolling through a shared bind tag, bound once per process
+            TerminalText._instances[str(text_widget)] = self
+            if not TerminalText._class_bound:
+                for sequence in TerminalText.SCROLL_EVENTS:
+                    text_widget.bind_class(TerminalText.BIND_TAG, sequence, TerminalText._dispatch_manual_scroll)
+                TerminalText._class_bound = True
+            text_widget.bindtags((TerminalText.BIND_TAG,) + text_widget.bindtags())
+            
+            # Text still being typed is inserted under this tag and revealed gradually
+            self.text_widget.tag_configure("hidden", elide=True)
+
+        @property
+        def auto_scroll(self):
+            return self._auto_scroll
+            
+        @auto_scroll.setter
+        def auto_scroll(self, enabled):
+            """Pick the scroll step _pump runs, so it doesn't re-check the flag per tick"""
+            self._auto_scroll = enabled
+            if enabled:
+                self._scroll_action = lambda w=self.text_widget: w.see(tk.END)
+            else:
+                # Maintain the scroll position where the user left it
+                self._scroll_action = lambda w=self.text_widget: w.yview_moveto(self.last_visible_position)
+            
+        @staticmethod
+        def _dispatch_manual_scroll(event):
+            """Route a BIND_TAG scroll event to the TerminalText owning the widget"""
+            terminal = TerminalText._instances.get(str(event.widget))
+            if terminal is not None:
+                return terminal._on_manual_scroll(event)
             
-            # Bind key events that might cause scrolling
-            self.text_widget.bind("<Up>", self._on_manual_scroll)
-            self.text_widget.bind("<Down>", self._on_manual_scroll)
-            self.text_widget.bind("<Prior>", self._on_manual_scroll)  # Page Up
-            self.text_widget.bind("<Next>", self._on_manual_scroll)   # Page Down
-            self.text_widget.bind("<Home>", self._on_manual_scroll)
-            self.text_widget.bind("<End>", self._on_manual_scroll)
-
         def _on_manual_scroll(self, event=None):
             """Detect manual scrolling and disable auto-scroll"""
+            if not self.text_widget.winfo_exists():
+                return None
             # Get current view position
-            try:
-                first, last = self.text_widget.yview()
-                # If we're not at the bottom, disable auto-scrolling
-                if last < 1.0:
-                    self.auto_scroll = False
-                    # Store the current position
-                    self.last_visible_position = first
-                else:
-                    # If we're at the bottom, re-enable auto-scrolling
-                    self.auto_scroll = True
-            except:
-                pass
+            first, last = self.text_widget.yview()
+            # If we're not at the bottom, disable auto-scrolling
+            if last < 1.0:
+                self.auto_scroll = False
+                # Store the current position
+                self.last_visible_position = first
+            else:
+                # If we're at the bottom, re-enable auto-scrolling
+                self.auto_scroll = True
             
             # Allow the event to propagate
             return None
 
         def _check_if_at_bottom(self):
             """Check if the view is at the bottom of the text widget"""
-            try:
-                first, last = self.text_widget.yview()
-                return last >= 0.99  # Consider "almost at bottom" as "at bottom"
-            except:
+            if not self.text_widget.winfo_exists():
                 return True
+            first, last = self.text_widget.yview()
+            return last >= 0.99  # Consider "almost at bottom" as "at bottom"
 
         def _update_scroll_state(self):
             """Update the auto-scroll state based on current view position"""
@@ -784,42 +1196,117 @@ def define_gui_classes():
                 first, _ = self.text_widget.yview()
                 self.last_visible_position = first
 
-        def type_text(self, text, tag=None):
-            """Type text character by character with a typewriter effect"""
-            self.text_widget.config(state=tk.NORMAL)
+        def type_text(self, text, tag=None, on_done=None):
+            """
+            Queue text for output with a typewriter effect. Safe to call from any
+            thread; returns immediately. on_done, if given, runs on the Tk thread
+            once the text is fully shown.
+            """
+            self._enqueue((text, tag, on_done, True))
             
-            # Check if we're at the bottom before starting to type
-            self._update_scroll_state()
+        def write_block(self, text, tag=None, on_done=None):
+            """
+            Queue text that is shown all at once, in a single insert, once the
+            output ahead of it is done. For static banners and boxes where a
+            typewriter effect adds nothing.
+            """
+            self.write_blocks((text, tag), on_done=on_done)
             
-            # Remember the initial position
-            initial_auto_scroll = self.auto_scroll
+        def write_blocks(self, *segments, on_done=None):
+            """
+            Like write_block, for several (text, tag) segments that are shown
+            together with one insert call.
+            """
+            # Flattened into insert()'s "chars tagList chars tagList ..." arguments;
+            # "" rather than None for no tag, since tkinter stops at a None argument
+            args = tuple(item for text, tag in segments for item in (text, tag or ""))
+            self._enqueue((args, None, on_done, False))
+            
+        def _enqueue(self, item):
+            """Queue an output item and start _pump if it has gone idle"""
+            self.pending.put(item)
+            with self.pump_lock:
+                if self.pumping:
+                    return
+                self.pumping = True
+            self.text_widget.after_idle(self._pump)
+            
+        def _pump(self):
+            """Type the next few queued characters, then reschedule itself with after()"""
+            # Runs every few milliseconds, so look the widget and END up once
+            widget = self.text_widget
+            END = tk.END
+            if self.current is None:
+                # Checked under the lock so _enqueue can't slip an item in unseen
+                with self.pump_lock:
+                    try:
+                        text, tag, on_done, typed = self.pending.get_nowait()
+                    except queue.Empty:
+                        self.pumping = False  # Nothing left; _enqueue starts us again
+                        return
+                # Check if we're at the bottom before starting to type
+                self._update_scroll_state()
+                self.current = [text, tag, 0, on_done, typed]
+            
+            text, tag, index, on_done, typed = self.current
+            start = index
+            if typed:
+                chunk = text[index:index + self.chars_per_tick]
+                index += len(chunk)
+                finished = index >= len(text)
+            else:
+                finished = True
             
-            for char in text:
-                # Insert the character
-                self.text_widget.insert(tk.END, char, tag)
-                
-                # Only auto-scroll if it was enabled at the start of typing
-                # and hasn't been manually changed during typing
-                if initial_auto_scroll and self.auto_scroll:
-                    self.text_widget.see(tk.END)
-                elif not self.auto_scroll:
-                    # Maintain the scroll position where the user left it
-                    self.text_widget.yview_moveto(self.last_visible_position)
-                    
-                # Update the UI
-                self.text_widget.update()
-                
-                # Add delay for typewriter effect
-                delay = self.typing_speed + random.uniform(0, self.typing_variation)
-                time.sleep(delay)
+            widget.config(state=tk.NORMAL)
+            if not typed:
+                # Blocks carry ready-made insert() arguments (see write_blocks)
+                if text:
+                    widget.insert(END, *text)
+            else:
+                if start == 0:
+                    # Insert the whole text once, elided, and reveal it a few characters
+                    # per tick by moving the "reveal" mark instead of inserting each chunk
+                    text_start = widget.index("end-1c")
+                    widget.insert(END, text, (tag, "hidden") if tag else "hidden")
+                    widget.mark_set("reveal", text_start)
+                    widget.mark_gravity("reveal", tk.LEFT)
+                if finished:
+                    widget.tag_remove("hidden", "reveal", END)
+                else:
+                    reveal_to = f"reveal + {len(chunk)}c"
+                    widget.tag_remove("hidden", "reveal", reveal_to)
+                    widget.mark_set("reveal", reveal_to)
+            if finished:
+                self._trim()
+            
+            # Scrolling forces Tk to recompute line metrics, so while typing only
+            # do it every scroll_every characters and once the text is complete
+            if finished or start // self.scroll_every != index // self.scroll_every:
+                self._scroll_action()
+            widget.config(state=tk.DISABLED)
+            
+            if finished:
+                self.current = None
+                if on_done:
+                    on_done()
+            else:
+                self.current[2] = index
             
-            # Make sure the text widget is read-only again
-            self.text_widget.config(state=tk.DISABLED)
+            # Delay for the typewriter effect; Tk handles events in between
+            delay = (self.typing_speed + random.uniform(0, self.typing_variation)) * len(chunk) if typed else 0
+            widget.after(max(1, int(delay * 1000)), self._pump)
+            
+        def _trim(self):
+            """Drop the oldest lines once there are more than MAX_LINES (widget must be NORMAL)"""
+            end_line = int(self.text_widget.index("end-1c").split(".")[0])
+            if end_line > self.MAX_LINES:
+                self.text_widget.delete("1.0", f"{end_line - self.MAX_LINES}.0")
             
         def clear(self):
             """Clear the text widget and reset auto-scroll"""
             self.text_widget.config(state=tk.NORMAL)
-            self.text_widget.delete("1.0", tk.END)
+            # Keep the not-yet-revealed part of any text being typed
+            self.text_widget.delete("1.0", "reveal" if self.current else tk.END)
             self.text_widget.config(state=tk.DISABLED)
             self.auto_scroll = True
             
@@ -827,6 +1314,7 @@ def define_gui_classes():
             """Append text without typewriter effect"""
             self.text_widget.config(state=tk.NORMAL)
             self.text_widget.insert(tk.END, text, tag)
+            self._trim()
             
             # Only auto-scroll if enabled
             if self.auto_scroll:
@@ -839,6 +1327,13 @@ def define_gui_classes():
     # Main HIBPScannerApp Class
     ############################
     class HIBPScannerApp:
+        # Breach summary box; the borders and title block are the same for every breach
+        BOX_WIDTH  = 60
+        BOX_TOP    = "╔" + "═" * (BOX_WIDTH - 2) + "╗\n"
+        BOX_MID    = "╠" + "═" * (BOX_WIDTH - 2) + "╣\n"
+        BOX_BOT    = "╚" + "═" * (BOX_WIDTH - 2) + "╝\n"
+        BOX_HEADER = "\n" + BOX_TOP + f"║ {'BREACH DETAILS'.center(BOX_WIDTH - 4)} ║\n" + BOX_MID
+        
         def __init__(self, root):
             self.root = root
             self.root.title("NULLNET - SECURITY BREACH SCANNER")
@@ -877,8 +1372,7 @@ def define_gui_classes():
             # Initial welcome message
             self.display_welcome_message()
             
-            # Status indicator blink
-            self.online_visible = True
+            # Start the status bar clock
             self.update_status()
         
         def center_window(self):
@@ -1127,16 +1621,16 @@ def define_gui_classes():
             self.custom_scrollbar = GreenScrollbar(text_container, width=12)
             self.custom_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             
-            # Connect the text widget to the scrollbar
-            self.output_text.config(yscrollcommand=lambda first, last: self.custom_scrollbar.update_slider(first, last))
+            # Connect the text widget to the scrollbar, repainting at most once per frame
+            self._pending_scroll = None
+            self._scroll_after_id = None
+            self.output_text.config(yscrollcommand=self._sched_scroll)
             
             # Set up the scrollbar to control the text widget
             self.custom_scrollbar.set_target(self.output_text)
             
-            # Bind mouse wheel events to the text widget
-            self.output_text.bind("<MouseWheel>", self._on_mousewheel)  # Windows
-            self.output_text.bind("<Button-4>", self._on_mousewheel)    # Linux scroll up
-            self.output_text.bind("<Button-5>", self._on_mousewheel)    # Linux scroll down
+            # Mouse wheel over the text is left to the Text class binding; the slider
+            # follows through yscrollcommand, so no extra wheel bindings are needed
             
             # Configure the text widget to be read-only initially
             self.output_text.config(state=tk.DISABLED)
@@ -1147,9 +1641,18 @@ def define_gui_classes():
             self.output_text.tag_configure("warning", foreground=COLORS["warning"])
             self.output_text.tag_configure("accent", foreground=COLORS["accent"])
         
-        def _on_mousewheel(self, event):
-            """Forward mousewheel events from text widget to scrollbar"""
-            self.custom_scrollbar.on_mousewheel(event)
+        def _sched_scroll(self, first, last):
+            """yscrollcommand: remember the latest position and repaint the slider ~16ms later"""
+            self._pending_scroll = (first, last)
+            if self._scroll_after_id is None:
+                self._scroll_after_id = self.root.after(16, self._flush_scroll)
+
+        def _flush_scroll(self):
+            """Move the slider to the last position reported since the previous repaint"""
+            self._scroll_after_id = None
+            first, last = self._pending_scroll
+            # Tk hands yscrollcommand its fractions as strings
+            self.custom_scrollbar.update_slider(float(first), float(last))
 
         def create_status_bar(self):
             status_frame = tk.Frame(self.main_frame, bg=COLORS["bg"], height=25)
@@ -1178,19 +1681,7 @@ def define_gui_classes():
                 self.api_entry.config(show="*")
 
         def update_status(self):
-            now = datetime.now()
-            date_str = now.strftime("%Y.%m.%d")
-            time_str = now.strftime("%H:%M:%S")
-            self.datetime_label.config(text=f"DATE: {date_str} | TIME: {time_str}")
-            
-            # Toggle "[ ONLINE ]" text for effect
-            if self.online_visible:
-                self.status_indicator.config(text="[ ONLINE ]")
-                self.online_visible = False
-            else:
-                self.status_indicator.config(text="[ ONLINE ]")
-                self.online_visible = True
-                
+            self.datetime_label.config(text=time.strftime("DATE: %Y.%m.%d | TIME: %H:%M:%S"))
             self.root.after(1000, self.update_status)
 
         def display_welcome_message(self):
@@ -1208,7 +1699,7 @@ def define_gui_classes():
                 "READY TO SCAN FOR SECURITY BREACHES.\n"
                 "ENTER EMAIL ADDRESS OR BREACH NAME AND INITIATE SCAN.\n\n"
             )
-            self.terminal.type_text(welcome_text, "header")
+            self.terminal.write_block(welcome_text, "header")
 
         def clear_terminal(self):
             self.terminal.clear()
@@ -1227,12 +1718,12 @@ def define_gui_classes():
             api_key = self.api_var.get().strip()
 
             # 1) Remove any newlines/tabs
-            email = re.sub(r"[\r\n\t]+", "", email)
-            breach = re.sub(r"[\r\n\t]+", "", breach)
+            email = _RE_WS.sub("", email)
+            breach = _RE_WS.sub("", breach)
 
             # 2) Keep only normal ASCII letters, digits, underscores, hyphens, @, plus, etc.
-            email = re.sub(r"[^a-zA-Z0-9@._\-+]", "", email)
-            breach = re.sub(r"[^a-zA-Z0-9._\-]+", "", breach)
+            email = _RE_EMAIL_CHARS.sub("", email)
+            breach = _RE_BREACH_CHARS.sub("", breach)
 
             # Put them back in the text fields (sanitized)
             self.email_var.set(email)
@@ -1252,10 +1743,7 @@ def define_gui_classes():
             threading.Thread(target=self.perform_scan, args=(email, breach, api_key), daemon=True).start()
 
         def perform_scan(self, email, breach, api_key):
-            headers = {
-                "hibp-api-key": api_key,
-                "User-Agent": "NULLNETSecurityScanner/1.0"
-            }
+            headers = {"hibp-api-key": api_key}
             
             self.terminal.type_text("\n>>> INITIATING SCAN...\n", "accent")
             time.sleep(0.5)
@@ -1273,212 +1761,210 @@ def define_gui_classes():
                     self.terminal.type_text(">>> CONNECTING TO HIBP DATABASE...\n", "normal")
                     time.sleep(0.5)
                     
-                    resp = requests.get(url, headers=headers)
+                    resp = SESSION.get(url, headers=headers, timeout=HTTP_TIMEOUT)
                     
                     if resp.status_code == 404:
                         # 404 on this endpoint means "no breaches found"
                         beep_error()
-                        self.terminal.type_text("\n>>> SCAN COMPLETE: NO BREACHES FOUND\n", "accent")
-                        self.root.after(0, lambda: self.status_message.config(text="SCAN COMPLETE - NO BREACHES"))
+                        self.terminal.type_text(
+                            "\n>>> SCAN COMPLETE: NO BREACHES FOUND\n", "accent",
+                            on_done=lambda: self.status_message.config(text="SCAN COMPLETE - NO BREACHES")
+                        )
                         return
                         
                     resp.raise_for_status()
                     
                     breach_list = resp.json()
                     if not breach_list:
-                        self.terminal.type_text("\n>>> SCAN COMPLETE: NO BREACHES FOUND\n", "accent")
-                        self.root.after(0, lambda: self.status_message.config(text="SCAN COMPLETE - NO BREACHES"))
+                        self.terminal.type_text(
+                            "\n>>> SCAN COMPLETE: NO BREACHES FOUND\n", "accent",
+                            on_done=lambda: self.status_message.config(text="SCAN COMPLETE - NO BREACHES")
+                        )
                         return
                     
                     self.terminal.type_text(f"\n>>> ALERT: FOUND {len(breach_list)} BREACH(ES)\n", "warning")
                     time.sleep(0.5)
                     
-                    for breach_info in breach_list:
-                        breach_name = breach_info["Name"]
-                        self.terminal.type_text(f"\n>>> RETRIEVING DETAILS FOR: {breach_name}\n", "accent")
-                        time.sleep(0.3)
-                        
-                        breach_url = f"https://haveibeenpwned.com/api/v3/breach/{breach_name}"
-                        br_resp = requests.get(breach_url, headers=headers)
-                        br_resp.raise_for_status()
-                        
-                        breach_data = br_resp.json()
-                        
-                        json_filename = os.path.join(folder_name, f"{breach_name}.json")
-                        self.save_breach_data_to_json(breach_data, json_filename)
-                        self.terminal.type_text(f">>> SAVED: {json_filename}\n", "normal")
+                    save_errors = []  # (path, error) for files this scan failed to write
+                    
+                    # Fire off every detail request up front so the round trips overlap;
+                    # results are still consumed in list order to keep the output stable.
+                    executor = ThreadPoolExecutor(max_workers=BREACH_FETCH_WORKERS)
+                    try:
+                        futures = [
+                            (breach_info["Name"], executor.submit(fetch_breach_details, breach_info["Name"], headers))
+                            for breach_info in breach_list
+                        ]
                         
-                        self.display_breach_summary(breach_data)
+                        for breach_name, future in futures:
+                            self.terminal.type_text(f"\n>>> RETRIEVING DETAILS FOR: {breach_name}\n", "accent")
+                            time.sleep(0.3)
+                            
+                            breach_data = future.result()
+                            if breach_data is None:
+                                self.terminal.type_text(f">>> BREACH '{breach_name}' NOT FOUND\n", "warning")
+                                continue
+                            
+                            json_filename = os.path.join(folder_name, f"{breach_name}.json")
+                            queue_json_write(json_filename, breach_data, save_errors)
+                            self.terminal.type_text(f">>> SAVED: {json_filename}\n", "normal")
+                            
+                            self.display_breach_summary(breach_data)
+                    except BaseException:
+                        # Report errors (or Ctrl+C) now, not after every queued fetch and its retries
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+                    executor.shutdown()
+                    
+                    # Make sure everything reported as saved is actually on disk
+                    wait_for_json_writes()
+                    for json_filename, error in save_errors:
+                        beep_error()
+                        self.terminal.type_text(f"\n>>> ERROR SAVING {json_filename}: {error}\n", "warning")
                     
                     self.terminal.type_text("\n>>> SCAN COMPLETE\n", "accent")
-                    self.terminal.type_text(f">>> ALL DATA SAVED TO FOLDER: {folder_name}\n", "normal")
-                    self.root.after(0, lambda: self.status_message.config(text=f"SCAN COMPLETE - {len(breach_list)} BREACHES"))
+                    self.terminal.type_text(
+                        f">>> ALL DATA SAVED TO FOLDER: {folder_name}\n", "normal",
+                        on_done=lambda: self.status_message.config(text=f"SCAN COMPLETE - {len(breach_list)} BREACHES")
+                    )
                     
                 except requests.exceptions.RequestException as e:
                     beep_error()
-                    self.terminal.type_text(f"\n>>> ERROR: {str(e)}\n", "warning")
-                    self.root.after(0, lambda: self.status_message.config(text="SCAN FAILED - ERROR"))
+                    self.terminal.type_text(
+                        f"\n>>> ERROR: {str(e)}\n", "warning",
+                        on_done=lambda: self.status_message.config(text="SCAN FAILED - ERROR")
+                    )
             
             # If breach is provided
             if breach:
                 self.terminal.type_text(f"\n>>> RETRIEVING BREACH: {breach}\n", "header")
                 time.sleep(0.5)
                 
-                single_breach_url = f"https://haveibeenpwned.com/api/v3/breach/{breach}"
                 try:
                     self.terminal.type_text(">>> CONNECTING TO HIBP DATABASE...\n", "normal")
                     time.sleep(0.5)
                     
-                    resp = requests.get(single_breach_url, headers=headers)
+                    breach_data = fetch_breach_details(breach, headers)
                     
-                    if resp.status_code == 404:
+                    if breach_data is None:
                         beep_error()
-                        self.terminal.type_text(f"\n>>> BREACH '{breach}' NOT FOUND\n", "warning")
-                        self.root.after(0, lambda: self.status_message.config(text="BREACH NOT FOUND"))
+                        self.terminal.type_text(
+                            f"\n>>> BREACH '{breach}' NOT FOUND\n", "warning",
+                            on_done=lambda: self.status_message.config(text="BREACH NOT FOUND")
+                        )
                         return
                         
-                    resp.raise_for_status()
-                    
-                    breach_data = resp.json()
-                    
                     json_filename = f"{breach}.json"
                     self.save_breach_data_to_json(breach_data, json_filename)
                     self.terminal.type_text(f">>> SAVED: {json_filename}\n", "normal")
                     
                     self.display_breach_summary(breach_data)
                     
-                    self.terminal.type_text("\n>>> SCAN COMPLETE\n", "accent")
-                    self.root.after(0, lambda: self.status_message.config(text="BREACH DETAILS RETRIEVED"))
+                    self.terminal.type_text(
+                        "\n>>> SCAN COMPLETE\n", "accent",
+                        on_done=lambda: self.status_message.config(text="BREACH DETAILS RETRIEVED")
+                    )
                     
                 except requests.exceptions.RequestException as e:
                     beep_error()
-                    self.terminal.type_text(f"\n>>> ERROR: {str(e)}\n", "warning")
-                    self.root.after(0, lambda: self.status_message.config(text="SCAN FAILED - ERROR"))
+                    self.terminal.type_text(
+                        f"\n>>> ERROR: {str(e)}\n", "warning",
+                        on_done=lambda: self.status_message.config(text="SCAN FAILED - ERROR")
+                    )
 
         ###############################################
-        # HELPER: Print multi-line box with right edge
+        # HELPER: Build multi-line box with right edge
         ###############################################
-        def print_box_line(self, text, box_width=60, tag="normal"):
+        def box_line(self, text="", box_width=60, *, label=None, value=None):
             """
-            Print a single line inside the box, with left/right borders.
+            Build a single line for inside the box, with left/right borders.
             - box_width: total width including the borders.
             - We have '║ ' (2 chars) on the left and ' ║' (2 chars) on the right,
               so we can place up to (box_width - 4) visible chars of text inside.
+            - label/value: build a "Label:      value" row in one format call.
             """
             content_width = box_width - 4
+            if label is not None:
+                value_width = content_width - 13
+                return f"║ {label:<13}{value!s:<{value_width}.{value_width}} ║\n"
             # If text is longer, just truncate here. 
-            # (We do a more robust wrap in wrap_and_box_print if we want multi-line.)
+            # (We do a more robust wrap in wrap_box_lines if we want multi-line.)
             truncated = text[:content_width]
             # Left-justify within content_width
             padded = truncated.ljust(content_width)
-            line = f"║ {padded} ║\n"
-            self.terminal.type_text(line, tag)
+            return f"║ {padded} ║\n"
 
-        def wrap_and_box_print(self, text, box_width=60, tag="normal"):
+        def wrap_box_lines(self, text, box_width=60):
             """
             Break 'text' into multiple lines so each fits inside the box,
-            then print them with the left/right border.
+            and return them with the left/right border.
             """
-            content_width = box_width - 4
-            words = text.split()
-            current_line = ""
-
-            for w in words:
-                # If adding this word would exceed content_width, print current_line first
-                if len(current_line) + len(w) + (1 if current_line else 0) > content_width:
-                    self.print_box_line(current_line, box_width, tag)
-                    current_line = w
-                else:
-                    # Add word to current line
-                    if current_line:
-                        current_line += " " + w
-                    else:
-                        current_line = w
-
-            # Print any leftover
-            if current_line:
-                self.print_box_line(current_line, box_width, tag)
+            return [self.box_line(line, box_width) for line in _get_wrapper(box_width - 4).wrap(text)]
 
         def display_breach_summary(self, breach_data):
-            box_width = 60
-            top_border =  "╔" + "═" * (box_width - 2) + "╗\n"
-            mid_border =  "╠" + "═" * (box_width - 2) + "╣\n"
-            bot_border =  "╚" + "═" * (box_width - 2) + "╝\n"
-
-            # Top border
-            self.terminal.type_text("\n" + top_border, "header")
-
-            # Centered title
-            title_str = "BREACH DETAILS"
-            # We have "║ " + text + " ║", so effectively box_width - 4 chars for text
-            centered_title = title_str.center(box_width - 4)
-            self.print_box_line(centered_title, box_width, tag="header")
-
-            # Mid border
-            self.terminal.type_text(mid_border, "header")
+            """Build the summary box and write it with a single insert."""
+            box_width = self.BOX_WIDTH
 
             # Key lines (Name, Title, etc.)
-            lines = [
-                ("Name",         breach_data.get("Name", "N/A")),
-                ("Title",        breach_data.get("Title", "N/A")),
-                ("Domain",       breach_data.get("Domain", "N/A")),
-                ("Breach Date",  breach_data.get("BreachDate", "N/A")),
-                ("Added Date",   breach_data.get("AddedDate", "N/A")),
-                ("Modified",     breach_data.get("ModifiedDate", "N/A")),
-                ("Pwn Count",    breach_data.get("PwnCount", "N/A")),
-            ]
-            for label, value in lines:
-                label_text = f"{label}:"
-                line_str = f"{label_text:<12} {value}"
-                self.print_box_line(line_str, box_width, "normal")
+            fields = _BREACH_FIELDS_TEMPLATE.format_map(_FieldsOrNA(breach_data))
+            body = [self.box_line(line, box_width) for line in fields.split("\n")]
 
             # Data classes
             data_classes = breach_data.get('DataClasses', [])
-            self.print_box_line("Data Classes:", box_width, "normal")
-            for cls in data_classes:
-                self.print_box_line(f"  - {cls}", box_width, "normal")
+            body.append(self.box_line("Data Classes:", box_width))
+            body.extend(self.box_line(f"  - {cls}", box_width) for cls in data_classes)
 
             verified = breach_data.get('IsVerified', 'N/A')
             fabricated = breach_data.get('IsFabricated', 'N/A')
-            self.print_box_line(f"Verified:    {verified}", box_width, "normal")
-            self.print_box_line(f"Fabricated:  {fabricated}", box_width, "normal")
+            body.append(self.box_line(box_width=box_width, label="Verified:", value=verified))
+            body.append(self.box_line(box_width=box_width, label="Fabricated:", value=fabricated))
 
-            # Blank line
-            self.print_box_line("", box_width, "normal")
-            # DESCRIPTION header
-            self.print_box_line("DESCRIPTION:", box_width, "normal")
+            # Blank line, then DESCRIPTION header
+            body.append(self.box_line("", box_width))
+            body.append(self.box_line("DESCRIPTION:", box_width))
 
             # Description (may be long)
             description = breach_data.get('Description', '')
             description_cleaned = self.clean_html_tags(description)
-            # Wrap and print in lines
-            self.wrap_and_box_print(description_cleaned, box_width, "normal")
+            body.extend(self.wrap_box_lines(description_cleaned, box_width))
 
-            # Bottom border
-            self.terminal.type_text(bot_border, "header")
+            # Bottom border closes the box in the header color again
+            self.terminal.write_blocks((self.BOX_HEADER, "header"), ("".join(body), "normal"), (self.BOX_BOT, "header"))
 
         def clean_html_tags(self, text):
-            text_no_tags = re.sub(r'<[^>]*>', '', text)
-            return html.unescape(text_no_tags)
+            return strip_html(text)
 
         def sanitize_email_for_folder(self, email):
-            folder_name = email.replace("@", "_at_").replace(".", "_dot_")
-            return folder_name
+            return email.translate(_EMAIL_FOLDER_TRANS)
 
         def save_breach_data_to_json(self, breach_data, filename):
-            with open(filename, "w", encoding="utf-8") as outfile:
-                json.dump(breach_data, outfile, indent=2)
+            # Encode up front (natively when orjson is installed) and write once
+            with open(filename, "wb") as outfile:
+                outfile.write(_dumps(breach_data))
+
 
+# WinAPI calls used by hide_console_window, resolved once with explicit
+# signatures so ctypes doesn't have to work out the argument types per call
+_ShowWindow = _GetConsoleWindow = None
+if SYSTEM == "Windows":
+    try:
+        import ctypes
+        from ctypes import wintypes
+        _ShowWindow = ctypes.windll.user32.ShowWindow
+        _ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+        _ShowWindow.restype = wintypes.BOOL
+        _GetConsoleWindow = ctypes.windll.kernel32.GetConsoleWindow
+        _GetConsoleWindow.argtypes = []
+        _GetConsoleWindow.restype = wintypes.HWND
+    except (ImportError, AttributeError, OSError):
+        _ShowWindow = _GetConsoleWindow = None
 
-# Function to hide console window on Windows
 def hide_console_window():
     """Hide the console window on Windows"""
-    if SYSTEM == "Windows":
-        try:
-            import ctypes
-            ctypes.windll.user32.ShowWindow(ctypes.windll.kernel32.GetConsoleWindow(), 0)
-        except:
-            pass
+    if _ShowWindow is not None:
+        hwnd = _GetConsoleWindow()
+        if hwnd:  # None when started without a console (e.g. pythonw)
+            _ShowWindow(hwnd, 0)  # SW_HIDE
 
 # Main execution block
 if __name__ == "__main__":
@@ -1493,11 +1979,13 @@ if __name__ == "__main__":
         if import_gui_modules():
             # Define GUI classes only when needed
             define_gui_classes()
-            # Start GUI application
-            root = tk.Tk()
+            # Start GUI application, reusing the display probe's root if there is one
+            root = _PROBE_ROOT if _PROBE_ROOT is not None else tk.Tk()
             app = HIBPScannerApp(root)
             root.mainloop()
         else:
+            if _PROBE_ROOT is not None:
+                _PROBE_ROOT.destroy()
             print("Failed to import GUI modules. Running in terminal-only mode.")
             app = TerminalOnlyApp()
     else: